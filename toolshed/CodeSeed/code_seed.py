@@ -94,7 +94,7 @@ class IdentifierTracker:
     identifiers capture developer intention to power code understanding.
     
     Attributes:
-        patterns: Regular expression patterns for identifying different types
+        patterns: Compiled regular expressions for identifying different types
             of code identifiers across multiple languages.
         contexts: Documentation and usage contexts associated with identifiers.
         relationship_map: Network of connections between related identifiers.
@@ -159,6 +159,13 @@ class IdentifierTracker:
             }
         }
         
+        # Compile each pattern once, since every file and scope reuses them
+        self.patterns = {
+            language: {id_type: re.compile(pattern, re.MULTILINE)
+                       for id_type, pattern in language_patterns.items()}
+            for language, language_patterns in self.patterns.items()
+        }
+        
         # Storage for identifier contexts
         self.contexts: Dict[str, Dict[str, Any]] = {}
         
@@ -188,9 +195,12 @@ class IdentifierTracker:
         # Container for findings
         identifiers: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         
+        # Identifiers already found in each scope of this content
+        scope_cache: Dict[Tuple[int, int], Set[str]] = {}
+        
         # Apply each pattern for the detected language
         for id_type, pattern in patterns.items():
-            matches = re.finditer(pattern, content, re.MULTILINE)
+            matches = pattern.finditer(content)
             
             # Extract and store each match with its context
             for match in matches:
@@ -202,7 +212,7 @@ class IdentifierTracker:
                         params = [p.strip() for p in param_str.split(',')]
                         for param in params:
                             # Handle default values, type hints, etc.
-                            param_name = param.split('=')[0].split(':')[0].strip()
+                            param_name = sys.intern(param.split('=')[0].split(':')[0].strip())
                             if param_name and param_name != 'self':
                                 # Create an identifier record
                                 identifier = {
@@ -214,8 +224,9 @@ class IdentifierTracker:
                                 }
                                 identifiers['parameter'].append(identifier)
                 else:
-                    # Standard identifier extraction
-                    id_name = match.group(1)
+                    # Standard identifier extraction (interned, since the
+                    # same names recur across files and relationship sets)
+                    id_name = sys.intern(match.group(1))
                     identifier = {
                         'name': id_name,
                         'type': id_type,
@@ -226,10 +237,12 @@ class IdentifierTracker:
                     identifiers[id_type].append(identifier)
                     
                     # Update relationship map for this identifier
-                    self._update_relationships(content, id_name, match)
+                    self._update_relationships(content, id_name, match, scope_cache)
         
-        logger.debug(f"Extracted {sum(len(ids) for ids in identifiers.values())} identifiers "
-                     f"of {len(identifiers)} types from {language} content")
+        # Only total the findings when debug output will actually be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d identifiers of %d types from %s content",
+                         sum(len(ids) for ids in identifiers.values()), len(identifiers), language)
         return identifiers
     
     def _determine_language(self, file_type: str) -> str:
@@ -330,7 +343,8 @@ class IdentifierTracker:
         
         return " | ".join(context)
     
-    def _update_relationships(self, content: str, id_name: str, match: re.Match) -> None:
+    def _update_relationships(self, content: str, id_name: str, match: re.Match,
+                              scope_cache: Optional[Dict[Tuple[int, int], Set[str]]] = None) -> None:
         """
         Update relationship map for an identifier.
         
@@ -342,6 +356,8 @@ class IdentifierTracker:
             content: Full file content.
             id_name: Name of the identifier.
             match: Regex match for the identifier.
+            scope_cache: Identifiers already found per (start, end) scope of
+                this content, shared across calls so each scope is scanned once.
         """
         # Skip very common or short identifiers to reduce noise
         if len(id_name) <= 2 or id_name in {'i', 'j', 'k', 'x', 'y', 'z'}:
@@ -357,18 +373,27 @@ class IdentifierTracker:
         if scope_end == -1:
             scope_end = len(content)
         
-        scope = content[scope_start:scope_end]
-        
-        # Find other identifiers in this scope
-        for pattern_type, patterns in self.patterns.items():
-            for _, pattern in patterns.items():
-                other_matches = re.finditer(pattern, scope, re.MULTILINE)
-                for other_match in other_matches:
-                    other_id = other_match.group(1)
-                    if other_id != id_name and len(other_id) > 2:
-                        # Add bidirectional relationship
-                        self.relationship_map[id_name].add(other_id)
-                        self.relationship_map[other_id].add(id_name)
+        # Find other identifiers in this scope, reusing an earlier scan
+        if scope_cache is None:
+            scope_cache = {}
+        scope_key = (scope_start, scope_end)
+        scope_ids = scope_cache.get(scope_key)
+        if scope_ids is None:
+            scope = content[scope_start:scope_end]
+            scope_ids = set()
+            for pattern_type, patterns in self.patterns.items():
+                for _, pattern in patterns.items():
+                    for other_match in pattern.finditer(scope):
+                        other_id = other_match.group(1)
+                        if len(other_id) > 2:
+                            scope_ids.add(sys.intern(other_id))
+            scope_cache[scope_key] = scope_ids
+        
+        for other_id in scope_ids:
+            if other_id != id_name:
+                # Add bidirectional relationship
+                self.relationship_map[id_name].add(other_id)
+                self.relationship_map[other_id].add(id_name)
     
     def get_identifier_data(self) -> List[Dict[str, Any]]:
         """
@@ -410,9 +435,9 @@ class DocumentationExtractor:
     that explain why code exists and how it functions.
     
     Attributes:
-        doc_patterns: Regular expression patterns for different types of
+        doc_patterns: Compiled regular expressions for different types of
             documentation across multiple languages.
-        cognitive_markers: Patterns identifying special documentation elements
+        cognitive_markers: Compiled patterns identifying special documentation elements
             that reveal developer thought processes.
     """
     
@@ -467,6 +492,17 @@ class DocumentationExtractor:
             'emphasis': r'!{2,}',  # Multiple exclamation points indicate emphasis
         }
         
+        # Compile each pattern once, since every file and docstring reuses them
+        self.doc_patterns = {
+            language: {doc_type: re.compile(pattern, re.MULTILINE | re.DOTALL)
+                       for doc_type, pattern in language_patterns.items()}
+            for language, language_patterns in self.doc_patterns.items()
+        }
+        self.cognitive_markers = {
+            marker_type: re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+            for marker_type, pattern in self.cognitive_markers.items()
+        }
+        
         logger.debug("DocumentationExtractor initialized with patterns for multiple languages")
     
     def extract_documentation(self, content: str, file_type: str) -> Dict[str, List[Dict[str, Any]]]:
@@ -492,7 +528,7 @@ class DocumentationExtractor:
         
         # Extract standard documentation based on language
         for doc_type, pattern in patterns.items():
-            matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
+            matches = pattern.finditer(content)
             
             for match in matches:
                 doc_content = match.group(1) if match.groups() else ""
@@ -514,7 +550,7 @@ class DocumentationExtractor:
         
         # Extract cognitive markers across all content
         for marker_type, pattern in self.cognitive_markers.items():
-            matches = re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE)
+            matches = pattern.finditer(content)
             
             for match in matches:
                 marker_content = match.group(1) if match.groups() else match.group(0)
@@ -525,8 +561,9 @@ class DocumentationExtractor:
                 }
                 documentation['cognitive_marker'].append(marker_record)
         
-        logger.debug(f"Extracted {sum(len(docs) for docs in documentation.values())} documentation "
-                     f"elements of {len(documentation)} types from {language} content")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d documentation elements of %d types from %s content",
+                         sum(len(docs) for docs in documentation.values()), len(documentation), language)
         return documentation
     
     def _determine_language(self, file_type: str) -> str:
@@ -596,12 +633,10 @@ class DocumentationExtractor:
                 # Remove the common indentation from all lines after the first
                 lines[1:] = [line[min_indent:] if line.strip() else line for line in lines[1:]]
         
-        # Rejoin and normalize whitespace
+        # Rejoin and normalize whitespace (str.split collapses runs and trims
+        # the ends exactly as \s+ would, without a regex pass per docstring)
         content = '\n'.join(lines)
-        content = re.sub(r'\s+', ' ', content)
-        content = content.strip()
-        
-        return content
+        return ' '.join(content.split())
     
     def _extract_cognitive_markers(self, content: str) -> Dict[str, List[str]]:
         """
@@ -620,7 +655,7 @@ class DocumentationExtractor:
         
         # Check for each marker type
         for marker_type, pattern in self.cognitive_markers.items():
-            matches = re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE)
+            matches = pattern.finditer(content)
             
             for match in matches:
                 marker_content = match.group(1) if match.groups() else match.group(0)
@@ -676,9 +711,9 @@ class PatternRecognizer:
     associations that indicate a healthy ecosystem.
     
     Attributes:
-        code_patterns: Templates of common code structures to recognize.
+        code_patterns: Compiled templates of common code structures to recognize.
         pattern_frequencies: Occurrence counts for recognized patterns.
-        signature_elements: Distinctive elements that define code "signatures".
+        signature_elements: Compiled elements that define code "signatures".
     """
     
     def __init__(self) -> None:
@@ -753,6 +788,17 @@ class PatternRecognizer:
             },
         }
         
+        # Compile each template once, since every file reuses them
+        self.code_patterns = {
+            pattern_name: re.compile(pattern, re.MULTILINE | re.DOTALL)
+            for pattern_name, pattern in self.code_patterns.items()
+        }
+        self.signature_elements = {
+            category: {element_name: re.compile(pattern, re.MULTILINE)
+                       for element_name, pattern in elements.items()}
+            for category, elements in self.signature_elements.items()
+        }
+        
         logger.debug("PatternRecognizer initialized with pattern templates")
     
     def recognize_patterns(self, content: str, file_type: str) -> Dict[str, int]:
@@ -774,15 +820,16 @@ class PatternRecognizer:
         
         # Apply each pattern
         for pattern_name, pattern in self.code_patterns.items():
-            matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
+            matches = pattern.finditer(content)
             count = sum(1 for _ in matches)
             
             if count > 0:
                 pattern_counts[pattern_name] = count
                 self.pattern_frequencies[pattern_name] += count
         
-        logger.debug(f"Recognized {sum(pattern_counts.values())} pattern instances "
-                     f"across {len(pattern_counts)} pattern types")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recognized %d pattern instances across %d pattern types",
+                         sum(pattern_counts.values()), len(pattern_counts))
         return dict(pattern_counts)
     
     def identify_signatures(self, content: str) -> Dict[str, Dict[str, int]]:
@@ -806,7 +853,7 @@ class PatternRecognizer:
             category_counts = {}
             
             for element_name, pattern in elements.items():
-                matches = re.finditer(pattern, content, re.MULTILINE)
+                matches = pattern.finditer(content)
                 count = sum(1 for _ in matches)
                 
                 if count > 0:
@@ -893,6 +940,7 @@ class FileAnalyzer:
         identifier_tracker: System for tracking and analyzing code identifiers.
         doc_extractor: System for extracting and analyzing documentation.
         pattern_recognizer: System for identifying code patterns.
+        marker_patterns: Compiled patterns for file-level cognitive markers.
     """
     
     def __init__(self) -> None:
@@ -908,6 +956,21 @@ class FileAnalyzer:
         self.doc_extractor = DocumentationExtractor()
         self.pattern_recognizer = PatternRecognizer()
         
+        # Common cognitive markers, compiled once for reuse across files
+        self.marker_patterns = {
+            marker_type: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            for marker_type, pattern in {
+                'todo': r'TODO[:\s]+(.*?)(?:\n|$)',
+                'fixme': r'FIXME[:\s]+(.*?)(?:\n|$)',
+                'note': r'NOTE[:\s]+(.*?)(?:\n|$)',
+                'hack': r'HACK[:\s]+(.*?)(?:\n|$)',
+                'bug': r'BUG[:\s]+(.*?)(?:\n|$)',
+                'question': r'(?:\?{3,}|\bQUESTION[:\s]+)(.*?)(?:\n|$)',
+                'important': r'IMPORTANT[:\s]+(.*?)(?:\n|$)',
+                'emoji': r'([🌱🔍🧩🚀🔧🌉🧠🔄🪢🔨])',  # Track emoji usage
+            }.items()
+        }
+        
         logger.debug("FileAnalyzer initialized with specialized analyzers")
     
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
@@ -1006,7 +1069,7 @@ class FileAnalyzer:
                 else:
                     file_info['skip_reason'] = 'file_too_large'
             
-            logger.debug(f"Completed analysis of {file_path}")
+            logger.debug("Completed analysis of %s", file_path)
             return file_info
             
         except Exception as e:
@@ -1121,21 +1184,9 @@ class FileAnalyzer:
         """
         markers = defaultdict(list)
         
-        # Common cognitive markers
-        marker_patterns = {
-            'todo': r'TODO[:\s]+(.*?)(?:\n|$)',
-            'fixme': r'FIXME[:\s]+(.*?)(?:\n|$)',
-            'note': r'NOTE[:\s]+(.*?)(?:\n|$)',
-            'hack': r'HACK[:\s]+(.*?)(?:\n|$)',
-            'bug': r'BUG[:\s]+(.*?)(?:\n|$)',
-            'question': r'(?:\?{3,}|\bQUESTION[:\s]+)(.*?)(?:\n|$)',
-            'important': r'IMPORTANT[:\s]+(.*?)(?:\n|$)',
-            'emoji': r'([🌱🔍🧩🚀🔧🌉🧠🔄🪢🔨])',  # Track emoji usage
-        }
-        
         # Extract each marker type
-        for marker_type, pattern in marker_patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+        for marker_type, pattern in self.marker_patterns.items():
+            matches = pattern.finditer(content)
             for match in matches:
                 marker_text = match.group(1) if match.groups() else match.group(0)
                 markers[marker_type].append(marker_text.strip())
@@ -1276,7 +1327,7 @@ class DirectoryAnalyzer:
             # Check if this directory should be excluded
             rel_root = os.path.relpath(root, directory)
             if exclude_regex and exclude_regex.search(rel_root):
-                logger.debug(f"Skipping excluded directory: {rel_root}")
+                logger.debug("Skipping excluded directory: %s", rel_root)
                 dirs[:] = []  # Skip all subdirectories
                 continue
             
@@ -1290,13 +1341,19 @@ class DirectoryAnalyzer:
             # Count directories
             dir_info['directory_count'] += len(dirs)
             
+            # List this directory's files once for relationship mapping
+            try:
+                sibling_files = self._list_files(root)
+            except OSError:
+                sibling_files = None
+            
             # Process each file
             for filename in files:
                 # Check if file should be excluded
                 file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, directory)
+                rel_path = filename if rel_root == os.curdir else os.path.join(rel_root, filename)
                 if exclude_regex and exclude_regex.search(rel_path):
-                    logger.debug(f"Skipping excluded file: {rel_path}")
+                    logger.debug("Skipping excluded file: %s", rel_path)
                     continue
                 
                 # Analyze file
@@ -1319,7 +1376,7 @@ class DirectoryAnalyzer:
                         dir_info['language_breakdown'][language] = dir_info['language_breakdown'].get(language, 0) + 1
                     
                     # Map file relationships
-                    self._update_relationship_map(file_info, root, directory)
+                    self._update_relationship_map(file_info, root, directory, sibling_files)
                     
                     # Add to files list
                     dir_info['files'].append(file_info)
@@ -1380,7 +1437,24 @@ class DirectoryAnalyzer:
         
         return mime_map.get(mime_type, mime_type)
     
-    def _update_relationship_map(self, file_info: Dict[str, Any], current_dir: str, base_dir: str) -> None:
+    def _list_files(self, directory: str) -> List[str]:
+        """
+        List the regular files directly inside a directory.
+        
+        Takes a quick census of a single grove, reading each entry's type
+        from the directory listing itself rather than a separate stat call.
+        
+        Args:
+            directory: Directory to list.
+            
+        Returns:
+            Paths of the files, joined onto the directory path.
+        """
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_file()]
+    
+    def _update_relationship_map(self, file_info: Dict[str, Any], current_dir: str, base_dir: str,
+                                 sibling_files: Optional[List[str]] = None) -> None:
         """
         Update the relationship map for a file.
         
@@ -1392,6 +1466,8 @@ class DirectoryAnalyzer:
             file_info: File metadata.
             current_dir: Current directory being processed.
             base_dir: Base directory of the scan.
+            sibling_files: Files in current_dir, if already listed by the
+                caller; listed here otherwise.
         """
         file_path = file_info.get('path')
         if not file_path:
@@ -1399,10 +1475,10 @@ class DirectoryAnalyzer:
         
         try:
             # Find related files based on directory structure
-            parent_dir = os.path.basename(current_dir)
-            for other_file in os.listdir(current_dir):
-                other_path = os.path.join(current_dir, other_file)
-                if os.path.isfile(other_path) and other_path != file_path:
+            if sibling_files is None:
+                sibling_files = self._list_files(current_dir)
+            for other_path in sibling_files:
+                if other_path != file_path:
                     # Add relationship based on shared directory
                     self.relationship_map[file_path].add(other_path)
                     self.relationship_map[other_path].add(file_path)
@@ -1420,7 +1496,7 @@ class DirectoryAnalyzer:
                         self.relationship_map[other_info].add(file_path)
         
         except Exception as e:
-            logger.debug(f"Error updating relationship map for {file_path}: {e}")
+            logger.debug("Error updating relationship map for %s: %s", file_path, e)
     
     def _get_relationship_data(self) -> Dict[str, List[str]]:
         """
@@ -1524,8 +1600,8 @@ class OutputManager:
         for record in data:
             all_fields.update(record.keys())
         
-        # Sort fields for consistent output
-        fields = sorted(list(all_fields))
+        # Sort fields for consistent output (membership checks use the set)
+        fields = sorted(all_fields)
         
         # Write to CSV
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -1537,7 +1613,7 @@ class OutputManager:
                 # Process record to handle special values and truncate
                 processed_record = {}
                 for field, value in record.items():
-                    if field not in fields:
+                    if field not in all_fields:
                         continue
                     
                     if isinstance(value, (dict, list)):
@@ -1827,6 +1903,10 @@ def main():
         print("CodeSeed: Semantic Forest Mapper v1.0")
         return
     
+    # Validate the target before creating any output
+    if not os.path.isdir(args.directory):
+        parser.error(f"directory not found: {args.directory}")
+    
     # Configure logging level
     if args.verbose:
         logger.setLevel(logging.DEBUG)